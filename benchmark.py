@@ -0,0 +1,429 @@
+import argparse
+import cProfile
+import heapq
+import json
+import math
+import os
+import platform
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import matplotlib
+
+matplotlib.use("Agg")  # headless: жодних вікон під час вимірювань
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+import task_1_linked_list as task_1  # noqa: E402
+import task_2_pythagoras_tree as task_2  # noqa: E402
+import task_3_dijkstra_heap as task_3  # noqa: E402
+import task_4_heap_visualization as task_4  # noqa: E402
+import task_5_dfs_bfs_visualization as task_5  # noqa: E402
+import task_6_greedy_vs_dynamic as task_6  # noqa: E402
+import task_7_monte_carlo_dice as task_7  # noqa: E402
+from task_6_benchmark import generate_catalog  # noqa: E402
+
+
+SEED = 42
+DEFAULT_THRESHOLD = 0.25  # регресія, якщо стало гірше більш ніж на 25%
+MIN_SAMPLE_TIME = 0.005  # короткі виклики групуємо, щоб один замір тривав >= 5 мс
+MAX_NUMBER = 1024  # максимум викликів в одному замірі
+MIN_TOTAL_TIME = 0.2  # заміри повторюємо, доки сумарно не набіжить 0.2 с
+MAX_RUNS = 50
+DEFAULT_TIME_FLOOR = 0.00001  # різниця < 10 мкс на виклик — шум, не регресія
+MEMORY_FLOOR = 64 * 1024  # так само для різниці пам'яті < 64 KB
+
+
+# -----------------------------
+# Генератори вхідних даних
+# (графіки не відкриваються: matplotlib працює з бекендом Agg)
+# -----------------------------
+def make_linked_list(n: int):
+    rng = random.Random(SEED)
+    ll = task_1.LinkedList()
+    # append() — O(n) на елемент, тому з'єднуємо вузли напряму
+    tail = None
+    for _ in range(n):
+        node = task_1.Node(rng.randint(0, 10 * n))
+        if tail is None:
+            ll.head = node
+        else:
+            tail.next = node
+        tail = node
+    return ll
+
+
+def make_pythagoras_axes(depth: int):
+    fig, ax = plt.subplots()
+    return fig, ax, depth
+
+
+def make_graph(n: int) -> task_3.Graph:
+    """Зв'язний неорієнтований граф: кільце + ~3n випадкових ребер."""
+    rng = random.Random(SEED)
+    graph: task_3.Graph = {v: [] for v in range(n)}
+
+    def add_edge(u, v):
+        w = rng.randint(1, 100)
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+
+    for v in range(n):
+        add_edge(v, (v + 1) % n)
+    for _ in range(3 * n):
+        add_edge(rng.randrange(n), rng.randrange(n))
+    return graph
+
+
+def make_heap(n: int) -> list[int]:
+    rng = random.Random(SEED)
+    heap = [rng.randint(0, 10 * n) for _ in range(n)]
+    heapq.heapify(heap)
+    return heap
+
+
+def make_tree(n: int):
+    """Повне бінарне дерево з n вузлів task_5.Node (як heap_to_tree)."""
+    nodes = [task_5.Node(i) for i in range(n)]
+    for i in range(n):
+        if 2 * i + 1 < n:
+            nodes[i].left = nodes[2 * i + 1]
+        if 2 * i + 2 < n:
+            nodes[i].right = nodes[2 * i + 2]
+    return nodes[0]
+
+
+def make_catalog(n: int):
+    return generate_catalog(n, "correlated", seed=SEED)
+
+
+# -----------------------------
+# Набір бенчмарків
+# -----------------------------
+def _close_figure(state):
+    plt.close(state[0])
+
+
+# name -> (setup(n) -> state, run(state), teardown(state) | None, sizes, quick_sizes)
+BENCHMARKS = {
+    "linked_list_sort": (
+        make_linked_list,
+        lambda ll: ll.sort(),
+        None,
+        [1_000, 10_000, 100_000],
+        [1_000, 10_000],
+    ),
+    "pythagoras_tree": (
+        make_pythagoras_axes,
+        lambda s: task_2.pythagoras_tree(
+            s[1], (0.0, 0.0), (1.0, 0.0), (0.0, 1.0), s[2], math.radians(45)
+        ),
+        _close_figure,
+        [6, 8, 10, 12],
+        [6, 8],
+    ),
+    "dijkstra": (
+        make_graph,
+        lambda g: task_3.dijkstra(g, 0),
+        None,
+        [1_000, 10_000, 100_000],
+        [1_000, 10_000],
+    ),
+    "heap_to_tree": (
+        make_heap,
+        task_4.heap_to_tree,
+        None,
+        [1_000, 10_000, 100_000],
+        [1_000, 10_000],
+    ),
+    "iter_nodes_bfs": (
+        make_tree,
+        task_5.iter_nodes_bfs,
+        None,
+        [1_000, 10_000, 100_000],
+        [1_000, 10_000],
+    ),
+    "dynamic_programming": (
+        make_catalog,
+        lambda items: task_6.dynamic_programming(items, 1_000),
+        None,
+        [10, 100, 1_000],
+        [10, 100],
+    ),
+    "dynamic_programming_compact": (
+        make_catalog,
+        lambda items: task_6.dynamic_programming(items, 1_000, mode="compact"),
+        None,
+        [10, 100, 1_000],
+        [10, 100],
+    ),
+    "monte_carlo_dice": (
+        lambda n: n,
+        lambda n: task_7.monte_carlo_dice(n, seed=SEED),
+        None,
+        [10_000, 100_000, 1_000_000],
+        [10_000, 100_000],
+    ),
+    "monte_carlo_dice_numpy": (
+        lambda n: n,
+        lambda n: task_7.monte_carlo_dice(n, seed=SEED, backend="numpy"),
+        None,
+        [100_000, 1_000_000, 10_000_000],
+        [100_000, 1_000_000],
+    ),
+}
+
+
+# -----------------------------
+# Вимірювання
+# -----------------------------
+def measure(name: str, n: int, repeats: int, profile_dir: str | None = None):
+    """
+    Медіана й найкращий час одного виклику та пікова пам'ять окремого запуску.
+
+    Як timeit.autorange: короткі виклики групуються по number штук, щоб один
+    замір тривав щонайменше MIN_SAMPLE_TIME; час заміру ділиться на number.
+    Замірів щонайменше repeats, далі — доки сумарно не набіжить MIN_TOTAL_TIME
+    (але не більше MAX_RUNS). setup/teardown у вимірювання не входять;
+    кожен виклик отримує свіжі дані.
+    """
+    setup, run, teardown, _, _ = BENCHMARKS[name]
+
+    def once(wrapper=None):
+        state = setup(n)
+        try:
+            return wrapper(lambda: run(state))
+        finally:
+            if teardown:
+                teardown(state)
+
+    def sample(number: int) -> float:
+        states = [setup(n) for _ in range(number)]
+        try:
+            t0 = time.perf_counter()
+            for state in states:
+                run(state)
+            return time.perf_counter() - t0
+        finally:
+            if teardown:
+                for state in states:
+                    teardown(state)
+
+    # Калібрування: подвоюємо number, доки замір не стане достатньо довгим
+    number = 1
+    while number < MAX_NUMBER and sample(number) < MIN_SAMPLE_TIME:
+        number *= 2
+
+    times = []
+    while len(times) < repeats or (
+        sum(times) * number < MIN_TOTAL_TIME and len(times) < MAX_RUNS
+    ):
+        times.append(sample(number) / number)
+    times.sort()
+    median = times[len(times) // 2]
+
+    def traced(call):
+        tracemalloc.start()
+        try:
+            call()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    peak = once(traced)
+
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+        profiler = cProfile.Profile()
+        once(lambda call: profiler.runcall(call))
+        path = os.path.join(profile_dir, f"{name}_{n}.prof")
+        profiler.dump_stats(path)
+
+    return {
+        "benchmark": name,
+        "n": n,
+        "time_s": median,
+        "time_best_s": times[0],
+        "runs": len(times),
+        "number": number,
+        "peak_bytes": peak,
+    }
+
+
+def run_all(names, quick: bool, repeats: int, profile_dir: str | None = None):
+    results = []
+    for name in names:
+        sizes = BENCHMARKS[name][4] if quick else BENCHMARKS[name][3]
+        for n in sizes:
+            row = measure(name, n, repeats, profile_dir)
+            results.append(row)
+            print(
+                f"{name:<28} n={n:>10,} | {row['time_s'] * 1000:>10.3f} мс"
+                f" (медіана з {row['runs']:>2} × {row['number']:>4})"
+                f" | {row['peak_bytes'] / 1024:>12.1f} KB"
+            )
+    return results
+
+
+def print_hotspots(profile_dir: str, top: int):
+    for filename in sorted(os.listdir(profile_dir)):
+        if filename.endswith(".prof"):
+            print(f"\n=== {filename} ===")
+            stats = pstats.Stats(os.path.join(profile_dir, filename))
+            stats.sort_stats("cumulative").print_stats(top)
+
+
+# -----------------------------
+# Результати та baseline
+# -----------------------------
+def make_report(results, label: str):
+    return {
+        "label": label,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_with_baseline(
+    results, baseline, threshold: float, time_floor: float = DEFAULT_TIME_FLOOR
+):
+    """
+    Повертає список регресій: (benchmark, n, метрика, було, стало, відношення).
+    Порівнюються лише пари (benchmark, n), присутні в обох звітах, і лише
+    зміни, більші за поріг шуму за абсолютною різницею (time_floor на виклик,
+    MEMORY_FLOOR для пам'яті). Час порівнюється за time_best_s.
+    """
+    # Для часу беремо найкращий запуск: сторонні навантаження лише додають час,
+    # тож мінімум стабільніший за медіану між процесами
+    floors = {"time_best_s": time_floor, "peak_bytes": MEMORY_FLOOR}
+    base = {(r["benchmark"], r["n"]): r for r in baseline["results"]}
+    regressions = []
+    for row in results:
+        old = base.get((row["benchmark"], row["n"]))
+        if old is None or "time_best_s" not in old:
+            continue
+        for metric, floor in floors.items():
+            if row[metric] - old[metric] < floor:
+                continue
+            if old[metric] > 0:
+                ratio = row[metric] / old[metric]
+                if ratio > 1 + threshold:
+                    regressions.append(
+                        (
+                            row["benchmark"],
+                            row["n"],
+                            metric,
+                            old[metric],
+                            row[metric],
+                            ratio,
+                        )
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк усіх завдань (1-7).")
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=list(BENCHMARKS),
+        default=list(BENCHMARKS),
+        help="Запустити лише вибрані бенчмарки.",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Менші розміри входу (для швидкої перевірки).",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="Мінімум повторів для часу (береться медіана). Типово 5.",
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="Зберегти результати в JSON."
+    )
+    parser.add_argument("--label", default="dev", help="Мітка версії у звіті.")
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="JSON з попереднім запуском для пошуку регресій.",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Перезаписати --baseline поточними результатами.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Допустиме погіршення часу/пам'яті (частка). Типово 0.25.",
+    )
+    parser.add_argument(
+        "--time-floor",
+        type=float,
+        default=DEFAULT_TIME_FLOOR,
+        help="Приріст часу на виклик (с), менший за який регресію не фіксуємо"
+        " — це шум. Типово 0.00001.",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help="Каталог для cProfile-дампів (.prof) кожного запуску.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=15,
+        help="Скільки гарячих функцій показати з --profile. Типово 15.",
+    )
+    args = parser.parse_args()
+
+    results = run_all(args.only, args.quick, args.repeats, args.profile)
+    report = make_report(results, args.label)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.profile:
+        print_hotspots(args.profile, args.top)
+
+    if not args.baseline:
+        return 0
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nBaseline збережено: {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = compare_with_baseline(
+        results, baseline, args.threshold, args.time_floor
+    )
+    if not regressions:
+        print(f"\nРегресій відносно {baseline['label']!r} не знайдено.")
+        return 0
+
+    print(f"\nРегресії відносно {baseline['label']!r} (поріг +{args.threshold:.0%}):")
+    for name, n, metric, old, new, ratio in regressions:
+        print(
+            f"  {name:<28} n={n:>10,} {metric:<10}"
+            f" {old:.4g} -> {new:.4g} (x{ratio:.2f})"
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
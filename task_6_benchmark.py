@@ -0,0 +1,272 @@
+import argparse
+import csv
+import json
+import platform
+import random
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from task_6_greedy_vs_dynamic import dynamic_programming, greedy_algorithm
+
+
+DISTRIBUTIONS = ("uncorrelated", "correlated", "strongly-correlated")
+DP_MODES = ("table", "compact")
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000]
+
+
+def generate_catalog(
+    n: int, distribution: str, max_cost: int = 100, seed: int | None = None
+) -> Dict[str, Dict[str, int]]:
+    """
+    Синтетичний каталог страв у форматі `items` з task_6.
+      uncorrelated        — cost і calories незалежні, U[1, max_cost];
+      correlated          — calories = cost ± max_cost/10 (слабка кореляція);
+      strongly-correlated — calories = cost + max_cost/10 (найважчий для greedy).
+    """
+    rng = random.Random(seed)
+    spread = max(1, max_cost // 10)
+    catalog: Dict[str, Dict[str, int]] = {}
+
+    for i in range(n):
+        cost = rng.randint(1, max_cost)
+        if distribution == "uncorrelated":
+            calories = rng.randint(1, max_cost)
+        elif distribution == "correlated":
+            calories = max(1, cost + rng.randint(-spread, spread))
+        elif distribution == "strongly-correlated":
+            calories = cost + spread
+        else:
+            raise ValueError(f"Невідомий розподіл: {distribution!r}.")
+        catalog[f"item_{i}"] = {"cost": cost, "calories": calories}
+
+    return catalog
+
+
+def fractional_upper_bound(items: Dict[str, Dict[str, int]], budget: int) -> float:
+    """
+    Верхня межа оптимуму 0/1 knapsack — розв'язок дробової задачі:
+    беремо страви за спаданням calories/cost, від критичної — частку. O(n log n).
+    """
+    sorted_items = sorted(
+        items.values(), key=lambda d: d["calories"] / d["cost"], reverse=True
+    )
+    left = budget
+    bound = 0.0
+    for data in sorted_items:
+        if data["cost"] <= left:
+            left -= data["cost"]
+            bound += data["calories"]
+        else:
+            bound += data["calories"] * left / data["cost"]
+            break
+    return bound
+
+
+def measure(func: Callable[[], Dict[str, object]], repeats: int):
+    """
+    Найкращий час з `repeats` запусків (секунди) та пікова пам'ять (байти).
+    Пам'ять міряємо окремим запуском під tracemalloc, щоб не псувати час.
+    """
+    best = float("inf")
+    result: Dict[str, object] = {}
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, best, peak
+
+
+def run_benchmark(
+    sizes: List[int],
+    distributions: List[str],
+    budget_ratio: float = 0.5,
+    budget: int | None = None,
+    max_dp_cells: int = 5_000_000,
+    repeats: int = 3,
+    seed: int = 42,
+) -> List[Dict[str, object]]:
+    """
+    Для кожного (розподіл, розмір) порівнює greedy з усіма режимами DP.
+    DP пропускається, якщо таблиця n * (budget + 1) більша за max_dp_cells.
+
+    gap             — розрив greedy від точного оптимуму DP (якщо DP виконано);
+    gap_upper_bound — розрив greedy від дробової верхньої межі, є завжди
+                      й обмежує справжній розрив зверху.
+    """
+    rows: List[Dict[str, object]] = []
+
+    for distribution in distributions:
+        for n in sizes:
+            catalog = generate_catalog(n, distribution, seed=seed)
+            total_cost = sum(d["cost"] for d in catalog.values())
+            cap = budget if budget is not None else int(total_cost * budget_ratio)
+
+            g, g_time, g_peak = measure(lambda: greedy_algorithm(catalog, cap), repeats)
+            rows.append(
+                {
+                    "distribution": distribution,
+                    "n": n,
+                    "budget": cap,
+                    "algorithm": "greedy",
+                    "time_s": g_time,
+                    "peak_bytes": g_peak,
+                    "total_calories": g["total_calories"],
+                    "gap": None,
+                    "gap_upper_bound": None,
+                    "skipped": False,
+                }
+            )
+            greedy_row = rows[-1]
+
+            optimum = None
+            for mode in DP_MODES:
+                row: Dict[str, object] = {
+                    "distribution": distribution,
+                    "n": n,
+                    "budget": cap,
+                    "algorithm": f"dp-{mode}",
+                    "time_s": None,
+                    "peak_bytes": None,
+                    "total_calories": None,
+                    "gap": None,
+                    "gap_upper_bound": None,
+                    "skipped": n * (cap + 1) > max_dp_cells,
+                }
+                if not row["skipped"]:
+                    d, d_time, d_peak = measure(
+                        lambda: dynamic_programming(catalog, cap, mode=mode), repeats
+                    )
+                    row.update(
+                        time_s=d_time,
+                        peak_bytes=d_peak,
+                        total_calories=d["total_calories"],
+                        gap=0.0,
+                    )
+                    optimum = d["total_calories"]
+                rows.append(row)
+
+            # Відносний розрив greedy від оптимуму (0.0 — greedy оптимальний)
+            if optimum:
+                greedy_row["gap"] = (optimum - g["total_calories"]) / optimum
+            bound = fractional_upper_bound(catalog, cap)
+            if bound > 0:
+                greedy_row["gap_upper_bound"] = (bound - g["total_calories"]) / bound
+
+    return rows
+
+
+def write_csv(rows: List[Dict[str, object]], path: str):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows: List[Dict[str, object]], path: str, label: str):
+    payload = {
+        "label": label,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "results": rows,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+
+def print_rows(rows: List[Dict[str, object]]):
+    print(
+        "Розподіл            |       n | Алгоритм   |     Час, с |  Пам'ять, KB |"
+        "  Калорії |     Gap | Gap ≤ (UB)"
+    )
+    print("-" * 104)
+    for r in rows:
+        if r["skipped"]:
+            print(
+                f"{r['distribution']:<19} | {r['n']:>7} | {r['algorithm']:<10} |"
+                " пропущено (занадто велика таблиця DP)"
+            )
+            continue
+        gap = "" if r["gap"] is None else f"{r['gap']:.2%}"
+        gap_ub = "" if r["gap_upper_bound"] is None else f"{r['gap_upper_bound']:.2%}"
+        print(
+            f"{r['distribution']:<19} | {r['n']:>7} | {r['algorithm']:<10} |"
+            f" {r['time_s']:>10.4f} | {r['peak_bytes'] / 1024:>12.1f} |"
+            f" {r['total_calories']:>8} | {gap:>7} | {gap_ub}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Greedy vs DP benchmark (task 6).")
+    parser.add_argument(
+        "-n",
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Розміри каталогу. Типово 10 100 1000 10000 100000.",
+    )
+    parser.add_argument(
+        "--distributions",
+        nargs="+",
+        choices=DISTRIBUTIONS,
+        default=list(DISTRIBUTIONS),
+        help="Розподіли cost/calories. Типово всі три.",
+    )
+    parser.add_argument(
+        "--budget-ratio",
+        type=float,
+        default=0.5,
+        help="Бюджет як частка сумарної вартості каталогу. Типово 0.5",
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="Фіксований бюджет для всіх розмірів (замість --budget-ratio).",
+    )
+    parser.add_argument(
+        "--max-dp-cells",
+        type=int,
+        default=5_000_000,
+        help="Ліміт n * (budget + 1) для DP, більші задачі пропускаються.",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Повтори для часу.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed генератора.")
+    parser.add_argument("--csv", default=None, help="Шлях до CSV з результатами.")
+    parser.add_argument("--json", default=None, help="Шлях до JSON з результатами.")
+    parser.add_argument(
+        "--label",
+        default="dev",
+        help="Мітка версії в JSON (для порівняння між версіями).",
+    )
+    args = parser.parse_args()
+
+    rows = run_benchmark(
+        sizes=args.sizes,
+        distributions=args.distributions,
+        budget_ratio=args.budget_ratio,
+        budget=args.budget,
+        max_dp_cells=args.max_dp_cells,
+        repeats=args.repeats,
+        seed=args.seed,
+    )
+    print_rows(rows)
+
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.json:
+        write_json(rows, args.json, args.label)
+
+
+if __name__ == "__main__":
+    main()
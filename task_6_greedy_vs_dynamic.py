@@ -44,13 +44,36 @@ def greedy_algorithm(
 
 
 def dynamic_programming(
-    items: Dict[str, Dict[str, int]], budget: int
+    items: Dict[str, Dict[str, int]], budget: int, mode: str = "table"
 ) -> Dict[str, object]:
     """
     Динамічне програмування (0/1 knapsack):
     кожну страву можна взяти 0 або 1 раз.
     Повертає оптимальний набір страв для max калорій при обмеженні budget.
+
+    mode:
+      'table'   — повна таблиця dp[i][b] (класичний варіант);
+      'compact' — один рядок dp[b] + bytearray-прапорці "взяли i-й"
+                  для відновлення набору (значно менше пам'яті).
     """
+    if mode == "table":
+        chosen = _dp_table(items, budget)
+    elif mode == "compact":
+        chosen = _dp_compact(items, budget)
+    else:
+        raise ValueError("mode має бути 'table' або 'compact'.")
+
+    total_cost = sum(items[name]["cost"] for name in chosen)
+    total_calories = sum(items[name]["calories"] for name in chosen)
+
+    return {
+        "chosen": chosen,
+        "total_cost": total_cost,
+        "total_calories": total_calories,
+    }
+
+
+def _dp_table(items: Dict[str, Dict[str, int]], budget: int) -> List[str]:
     names = list(items.keys())
     costs = [items[n]["cost"] for n in names]
     calories = [items[n]["calories"] for n in names]
@@ -76,14 +99,38 @@ def dynamic_programming(
             b -= costs[i - 1]
 
     chosen.reverse()
-    total_cost = sum(items[name]["cost"] for name in chosen)
-    total_calories = sum(items[name]["calories"] for name in chosen)
+    return chosen
 
-    return {
-        "chosen": chosen,
-        "total_cost": total_cost,
-        "total_calories": total_calories,
-    }
+
+def _dp_compact(items: Dict[str, Dict[str, int]], budget: int) -> List[str]:
+    names = list(items.keys())
+    costs = [items[n]["cost"] for n in names]
+    calories = [items[n]["calories"] for n in names]
+
+    # dp[b] = макс калорій для бюджету b (один рядок, йдемо по b згори вниз)
+    dp = [0] * (budget + 1)
+    # take[i][b] = 1, якщо при бюджеті b i-й предмет покращив результат
+    take: List[bytearray] = []
+
+    for cost_i, cal_i in zip(costs, calories):
+        flags = bytearray(budget + 1)
+        for b in range(budget, cost_i - 1, -1):
+            candidate = dp[b - cost_i] + cal_i
+            if candidate > dp[b]:
+                dp[b] = candidate
+                flags[b] = 1
+        take.append(flags)
+
+    # Відновлення набору
+    chosen: List[str] = []
+    b = budget
+    for i in range(len(names) - 1, -1, -1):
+        if take[i][b]:
+            chosen.append(names[i])
+            b -= costs[i]
+
+    chosen.reverse()
+    return chosen
 
 
 if __name__ == "__main__":
@@ -91,6 +138,8 @@ if __name__ == "__main__":
 
     g = greedy_algorithm(items, budget)
     d = dynamic_programming(items, budget)
+    dc = dynamic_programming(items, budget, mode="compact")
 
-    print("Greedy:", g)
-    print("DP    :", d)
+    print("Greedy    :", g)
+    print("DP        :", d)
+    print("DP compact:", dc)
@@ -1,62 +1,696 @@
+import argparse
+import json
+import math
+import numbers
+import os
 import random
+import time
 from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+from itertools import accumulate
+
 import matplotlib.pyplot as plt
+import numpy as np
+
+
+BACKENDS = ("python", "numpy", "parallel")
+CRITERIA = ("analytic", "ci")
+DEFAULT_CHUNK_SIZE = 1_000_000
+DEFAULT_PROGRESS_EVERY = 1_000_000
+PYTHON_BENCHMARK_MAX_ROLLS = 1_000_000  # еталонний цикл повільний — не ганяємо 10^8
+PROGRESS_SINKS = ("console", "jsonl", "plot")
+Z_95 = 1.959963984540054  # квантиль N(0, 1) для 95% довірчого інтервалу
+FFT_THRESHOLD = 64  # від такої довжини многочленів згортка йде через FFT
+# Понад цю "роботу" (кубиків × можливих сум) точні лічильники не рахуємо,
+# а analytic_probabilities бере ймовірності з sum_distribution (FFT)
+EXACT_COUNTS_MAX_WORK = 1_000_000
+
+# Набір кубиків: кортеж, де кожен кубик — або кількість граней (чесний),
+# або кортеж цілих ваг граней 1..k (зважений), напр. (6, 6) чи ((1, 1, 1, 1, 1, 3),)
+TWO_D6 = (6, 6)
+
+
+def parse_dice(text: str) -> tuple:
+    """
+    Розбирає запис на кшталт '2d6', '10d20' або '3d6+1d4' у набір кубиків.
+    """
+    dice = []
+    for term in text.lower().replace(" ", "").split("+"):
+        count, sep, sides = term.partition("d")
+        if not sep or not sides.isdigit() or not (count == "" or count.isdigit()):
+            raise ValueError(f"Некоректний запис кубиків: {term!r} (очікується NdM).")
+        dice.extend([int(sides)] * int(count or 1))
+    return normalize_dice(tuple(dice))
+
+
+def normalize_dice(dice) -> tuple:
+    """
+    Приводить набір кубиків до канонічного вигляду (для кешу):
+    чесний кубик лишається int, зважений — кортежем int-ваг.
+    """
+    result = []
+    for die in dice:
+        if _is_integer(die):
+            if die < 1:
+                raise ValueError("Кубик має мати хоча б одну грань.")
+            result.append(int(die))
+            continue
+        try:
+            weights = tuple(die)
+        except TypeError:
+            raise ValueError(
+                f"Кубик має бути цілим числом граней або кортежем ваг, а не {die!r}."
+            ) from None
+        if not weights or any(not _is_integer(w) or w < 0 for w in weights):
+            raise ValueError("Ваги граней мають бути невід’ємними цілими числами.")
+        weights = tuple(int(w) for w in weights)
+        if sum(weights) == 0:
+            raise ValueError("Сума ваг граней має бути > 0.")
+        result.append(weights)
+    if not result:
+        raise ValueError("Потрібен хоча б один кубик.")
+    return tuple(result)
+
+
+def _is_integer(value) -> bool:
+    """int або numpy-ціле, але не bool."""
+    return isinstance(value, numbers.Integral) and not isinstance(value, bool)
+
+
+def format_dice(dice) -> str:
+    """Короткий підпис набору: '2d6', '10d20', '3d6+1d[1,1,2]'."""
+    groups = _group_dice(normalize_dice(dice))
+    parts = []
+    for die, count in groups:
+        faces = str(die) if isinstance(die, int) else "[" + ",".join(map(str, die)) + "]"
+        parts.append(f"{count}d{faces}")
+    return "+".join(parts)
+
+
+def sum_range(dice) -> range:
+    """Усі можливі суми набору (грані нумеруються з 1)."""
+    dice = normalize_dice(dice)
+    return range(len(dice), sum(_faces(die) for die in dice) + 1)
+
+
+def _faces(die) -> int:
+    return die if isinstance(die, int) else len(die)
+
+
+def _group_dice(dice: tuple) -> list[tuple]:
+    """[(кубик, кількість), ...] у порядку першої появи."""
+    groups = {}
+    for die in dice:
+        groups[die] = groups.get(die, 0) + 1
+    return list(groups.items())
+
+
+def _die_weights(die) -> list[int]:
+    """Многочлен кубика: індекс = значення грані, коефіцієнт = вага (грань 0 — 0)."""
+    if isinstance(die, int):
+        return [0] + [1] * die
+    return [0] + list(die)
+
+
+def _poly_mul_fair(poly: list[int], k: int) -> list[int]:
+    """
+    Множення на чесний кубик x + x^2 + ... + x^k — ковзна сума вікна з k
+    коефіцієнтів через префіксні суми, O(len(poly)) замість O(len(poly) * k).
+    """
+    prefix = [0, *accumulate(poly)]
+    n = len(poly)
+    out = [0] * (n + k)
+    for s in range(1, n + k):
+        out[s] = prefix[min(s, n)] - prefix[max(s - k, 0)]
+    return out
+
+
+def _poly_mul_exact(a: list[int], b: list[int]) -> list[int]:
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return out
+
+
+def _convolve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Згортка ймовірностей: напряму для коротких, через FFT для довгих."""
+    if min(len(a), len(b)) < FFT_THRESHOLD:
+        return np.convolve(a, b)
+    n = len(a) + len(b) - 1
+    size = 1 << (n - 1).bit_length()
+    out = np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)[:n]
+    return np.clip(out, 0.0, None)  # прибираємо від’ємний шум FFT
+
+
+def _poly_pow(poly, k: int, mul):
+    """Піднесення многочлена до степеня k через повторне піднесення до квадрата."""
+    result = None
+    while k:
+        if k & 1:
+            result = poly if result is None else mul(result, poly)
+        k >>= 1
+        if k:
+            poly = mul(poly, poly)
+    return result
+
 
+@lru_cache(maxsize=128)
+def _sum_counts_cached(dice: tuple) -> tuple[int, ...]:
+    # Кубик за кубиком: чесні — ковзним вікном, зважені — прямою згорткою O(L * k)
+    poly = [1]
+    for die in dice:
+        if isinstance(die, int):
+            poly = _poly_mul_fair(poly, die)
+        else:
+            poly = _poly_mul_exact(poly, _die_weights(die))
+    return tuple(poly)
 
-def analytic_probabilities():
+
+def _exact_work(dice: tuple) -> int:
+    return len(dice) * (max(sum_range(dice)) + 1)
+
+
+@lru_cache(maxsize=128)
+def _sum_distribution_cached(dice: tuple) -> np.ndarray:
+    poly = None
+    for die, count in _group_dice(dice):
+        weights = np.array(_die_weights(die), dtype=float)
+        part = _poly_pow(weights / weights.sum(), count, _convolve)
+        poly = part if poly is None else _convolve(poly, part)
+    poly.setflags(write=False)  # масив живе в кеші — захищаємо від змін
+    return poly
+
+
+def sum_counts(dice=TWO_D6) -> dict[int, int]:
+    """
+    Точна кількість (зважених) комбінацій для кожної суми —
+    цілочисельна згортка многочленів кубиків (для чесних — ковзне вікно,
+    O(L) на кубик). Результат кешується.
+    """
+    counts = _sum_counts_cached(normalize_dice(dice))
+    return {s: counts[s] for s in sum_range(dice)}
+
+
+def sum_distribution(dice=TWO_D6) -> dict[int, float]:
     """
-    Аналітичні ймовірності для суми двох чесних кубиків.
-    Кількість комбінацій = 36.
+    Ймовірності сум через згортку розподілів кубиків
+    (FFT для довгих многочленів, напр. 100d20). Результат кешується.
     """
-    counts = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 7: 6, 8: 5, 9: 4, 10: 3, 11: 2, 12: 1}
-    probs = {s: c / 36 for s, c in counts.items()}
+    probs = _sum_distribution_cached(normalize_dice(dice))
+    return {s: float(probs[s]) for s in sum_range(dice)}
+
+
+def analytic_probabilities(dice=TWO_D6, exact: bool | None = None):
+    """
+    Аналітичні ймовірності для суми набору кубиків (типово — два чесних d6).
+    Повертає (probs, counts). При exact=True ймовірності рахуються з точних
+    цілих лічильників (для 2d6 кількість комбінацій = 36); при exact=False —
+    через sum_distribution (FFT), а counts = None. Типово exact обирається
+    автоматично: точно, якщо набір не більший за EXACT_COUNTS_MAX_WORK.
+    """
+    dice = normalize_dice(dice)
+    if exact is None:
+        exact = _exact_work(dice) <= EXACT_COUNTS_MAX_WORK
+    if not exact:
+        return sum_distribution(dice), None
+
+    counts = sum_counts(dice)
+    total = sum(counts.values())
+    probs = {s: c / total for s, c in counts.items()}
     return probs, counts
 
 
-def monte_carlo_dice(num_rolls: int, seed: int | None = None):
+def monte_carlo_dice(
+    num_rolls: int,
+    seed: int | None = None,
+    backend: str = "python",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+    dice=TWO_D6,
+    progress=None,
+    progress_every: int = DEFAULT_PROGRESS_EVERY,
+):
     """
-    Монте-Карло симуляція кидків двох кубиків.
+    Монте-Карло симуляція кидків набору кубиків (типово — двох d6).
     Повертає: лічильники сум та ймовірності.
+
+    backend:
+      'python'   — цикл з random.randint (еталонна реалізація);
+      'numpy'    — векторизовано, кидки генеруються блоками по chunk_size,
+                   тож пам'ять (~chunk_size × кількість кубиків) не залежить
+                   від num_rolls;
+      'parallel' — блоки по chunk_size на пулі з workers процесів
+                   (див. monte_carlo_dice_parallel).
+
+    progress — необов'язковий callback(event), який отримує метрики прогресу
+    приблизно кожні progress_every кидків (див. ProgressTracker). Для numpy
+    і parallel події йдуть на межах блоків. Без callback — жодних витрат.
     """
+    dice = normalize_dice(dice)
+    if backend == "parallel":
+        return monte_carlo_dice_parallel(
+            num_rolls,
+            seed=seed,
+            workers=workers,
+            batch_size=chunk_size,
+            dice=dice,
+            progress=progress,
+            progress_every=progress_every,
+        )
+    tracker = ProgressTracker(progress, progress_every, dice) if progress else None
+    if backend == "numpy":
+        sums = _roll_numpy(num_rolls, seed, chunk_size, dice, tracker)
+    elif backend == "python":
+        sums = _roll_python(num_rolls, seed, dice, tracker)
+    else:
+        raise ValueError(f"backend має бути одним із {BACKENDS}.")
+
+    probs = {s: sums[s] / num_rolls for s in sum_range(dice)}
+    return sums, probs
+
+
+def _roll_segment_fair(n: int, faces: tuple[int, ...], sums: Counter):
+    """Швидкий шлях для чесних кубиків: без генераторів і лямбд."""
+    randint = random.randint
+    if len(faces) == 2:  # типовий 2d6 — розгорнутий цикл, як в еталоні
+        f1, f2 = faces
+        for _ in range(n):
+            sums[randint(1, f1) + randint(1, f2)] += 1
+        return
+    for _ in range(n):
+        total = 0
+        for f in faces:
+            total += randint(1, f)
+        sums[total] += 1
+
+
+def _roll_segment_weighted(n: int, dice: tuple, sums: Counter):
+    """Загальний шлях: зважені кубики через random.choices."""
+    randint = random.randint
+    choices = random.choices
+    samplers = [
+        (die, None) if isinstance(die, int) else (range(1, len(die) + 1), die)
+        for die in dice
+    ]
+    for _ in range(n):
+        total = 0
+        for faces, weights in samplers:
+            if weights is None:
+                total += randint(1, faces)
+            else:
+                total += choices(faces, weights=weights)[0]
+        sums[total] += 1
+
+
+def _roll_python(
+    num_rolls: int, seed: int | None, dice: tuple, tracker=None
+) -> Counter:
     if seed is not None:
         random.seed(seed)
 
+    all_fair = all(isinstance(die, int) for die in dice)
     sums = Counter()
-    for _ in range(num_rolls):
-        d1 = random.randint(1, 6)
-        d2 = random.randint(1, 6)
-        sums[d1 + d2] += 1
 
-    probs = {s: sums[s] / num_rolls for s in range(2, 13)}
+    # Без трекера — один сегмент, тобто внутрішній цикл без жодних перевірок
+    step = tracker.every if tracker else max(num_rolls, 1)
+    done = 0
+    while done < num_rolls:
+        n = min(step, num_rolls - done)
+        if all_fair:
+            _roll_segment_fair(n, dice, sums)
+        else:
+            _roll_segment_weighted(n, dice, sums)
+        done += n
+        if tracker and done < num_rolls:
+            tracker.update(done, _to_array(sums, dice))
+
+    if tracker:
+        tracker.finish(done, _to_array(sums, dice))
+    return sums
+
+
+def _roll_chunk(rng: np.random.Generator, n: int, dice: tuple) -> np.ndarray:
+    """Гістограма сум для n кидків набору (індекс = сума)."""
+    max_sum = sum(_faces(die) for die in dice)
+    total = np.zeros(n, dtype=np.int64)
+    for die, count in _group_dice(dice):
+        if isinstance(die, int):
+            dtype = np.uint8 if die < 256 else np.int64
+            values = rng.integers(1, die + 1, size=(count, n), dtype=dtype)
+        else:
+            weights = np.array(die, dtype=float)
+            values = rng.choice(
+                np.arange(1, len(die) + 1), size=(count, n), p=weights / weights.sum()
+            )
+        total += values.sum(axis=0, dtype=np.int64)
+    return np.bincount(total, minlength=max_sum + 1)
+
+
+def _to_counter(totals: np.ndarray, dice: tuple) -> Counter:
+    return Counter({s: int(totals[s]) for s in sum_range(dice) if totals[s]})
+
+
+def _to_array(sums: Counter, dice: tuple) -> np.ndarray:
+    totals = np.zeros(max(sum_range(dice)) + 1, dtype=np.int64)
+    for s, c in sums.items():
+        totals[s] = c
+    return totals
+
+
+def _roll_numpy(
+    num_rolls: int, seed: int | None, chunk_size: int, dice: tuple, tracker=None
+) -> Counter:
+    """
+    Кидки блоками через numpy.random.Generator, суми рахуємо bincount.
+    Результат відтворюваний для однакових (seed, chunk_size).
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size має бути > 0.")
+
+    rng = np.random.default_rng(seed)
+    totals = np.zeros(max(sum_range(dice)) + 1, dtype=np.int64)
+
+    remaining = num_rolls
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        totals += _roll_chunk(rng, n, dice)
+        remaining -= n
+        if tracker and remaining > 0:
+            tracker.update(num_rolls - remaining, totals)
+
+    if tracker:
+        tracker.finish(num_rolls, totals)
+    return _to_counter(totals, dice)
+
+
+def _roll_batch(
+    seed_seq: np.random.SeedSequence, batch_size: int, dice: tuple
+) -> np.ndarray:
+    """Один блок кидків у процесі-воркері; повертає гістограму сум."""
+    return _roll_chunk(np.random.default_rng(seed_seq), batch_size, dice)
+
+
+def _has_converged(
+    totals: np.ndarray, rolls: int, expected: np.ndarray, tolerance: float, criterion: str
+) -> bool:
+    """
+    'analytic' — max |P_mc - P_analytic| <= tolerance;
+    'ci'       — найширша півширина 95% інтервалу Вілсона <= tolerance.
+                 На відміну від Вальда (z*sqrt(p(1-p)/n)), він не схлопується
+                 в 0 при p = 0 чи 1, тож не зупиняє симуляцію після кількох кидків.
+    """
+    probs = totals / rolls
+    if criterion == "analytic":
+        return float(np.max(np.abs(probs - expected))) <= tolerance
+    z2 = Z_95 * Z_95
+    half_width = (
+        Z_95
+        / (1 + z2 / rolls)
+        * np.sqrt(probs * (1 - probs) / rolls + z2 / (4 * rolls * rolls))
+    )
+    return float(np.max(half_width)) <= tolerance
+
+
+def monte_carlo_dice_parallel(
+    num_rolls: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    batch_size: int = DEFAULT_CHUNK_SIZE,
+    tolerance: float | None = None,
+    criterion: str = "analytic",
+    dice=TWO_D6,
+    progress=None,
+    progress_every: int = DEFAULT_PROGRESS_EVERY,
+):
+    """
+    Паралельна Монте-Карло симуляція на пулі процесів.
+
+    num_rolls ділиться на блоки по batch_size; кожен блок має власний
+    незалежний потік, породжений SeedSequence(seed).spawn(), тому результат
+    не залежить від кількості workers. Гістограми блоків зливаються по мірі
+    надходження, але в підсумок ідуть строго по порядку номерів блоків.
+
+    Якщо задано tolerance, симуляція зупиняється після першого блоку,
+    на якому виконано критерій criterion ('analytic' або 'ci').
+    num_rolls тоді — верхня межа; фактична кількість = sum(sums.values()).
+
+    progress/progress_every — як у monte_carlo_dice, події після злиття блоків.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size має бути > 0.")
+    if criterion not in CRITERIA:
+        raise ValueError(f"criterion має бути одним із {CRITERIA}.")
+
+    dice = normalize_dice(dice)
+    workers = workers or os.cpu_count() or 1
+    n_batches = math.ceil(num_rolls / batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(n_batches)
+    sizes = [min(batch_size, num_rolls - i * batch_size) for i in range(n_batches)]
+    expected = _sum_distribution_cached(dice) if criterion == "analytic" else None
+    tracker = ProgressTracker(progress, progress_every, dice) if progress else None
+
+    totals = np.zeros(max(sum_range(dice)) + 1, dtype=np.int64)
+    rolls = 0
+    arrived = {}  # блоки, що прийшли раніше за попередні
+    next_merge = 0
+    next_submit = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Тримаємо в роботі лише ~2 блоки на воркер, щоб рано зупинитися
+        in_flight_limit = 2 * workers
+        running = {}
+        stop = False
+
+        while next_merge < n_batches and not stop:
+            while next_submit < n_batches and len(running) < in_flight_limit:
+                future = pool.submit(
+                    _roll_batch, seeds[next_submit], sizes[next_submit], dice
+                )
+                running[future] = next_submit
+                next_submit += 1
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                arrived[running.pop(future)] = future.result()
+
+            while next_merge in arrived:
+                totals += arrived.pop(next_merge)
+                rolls += sizes[next_merge]
+                next_merge += 1
+                if tolerance is not None and _has_converged(
+                    totals, rolls, expected, tolerance, criterion
+                ):
+                    stop = True
+                    break
+                if tracker and next_merge < n_batches:
+                    tracker.update(rolls, totals)
+
+        for future in running:
+            future.cancel()
+
+    if tracker:
+        tracker.finish(rolls, totals)
+    sums = _to_counter(totals, dice)
+    probs = {s: sums[s] / rolls for s in sum_range(dice)}
     return sums, probs
 
 
+class ProgressTracker:
+    """
+    Інструментація симуляції: не частіше ніж раз на every кидків викликає
+    callback(event), а в кінці — ще раз з final=True. event — словник:
+      rolls          — скільки кидків зроблено;
+      elapsed_s      — секунд від старту;
+      rolls_per_s    — середня швидкість від старту;
+      max_abs_error  — max |P_mc - P_analytic| по всіх сумах;
+      histogram      — знімок лічильників {сума: кількість};
+      final          — True для останньої події.
+    """
+
+    def __init__(self, callback, every: int = DEFAULT_PROGRESS_EVERY, dice=TWO_D6):
+        if every <= 0:
+            raise ValueError("progress_every має бути > 0.")
+        self.callback = callback
+        self.every = every
+        self.dice = normalize_dice(dice)
+        self.expected = _sum_distribution_cached(self.dice)
+        self.start = time.perf_counter()
+        self.next_at = every
+
+    def update(self, rolls: int, totals: np.ndarray):
+        if rolls >= self.next_at:
+            self._emit(rolls, totals, final=False)
+
+    def finish(self, rolls: int, totals: np.ndarray):
+        self._emit(rolls, totals, final=True)
+
+    def _emit(self, rolls: int, totals: np.ndarray, final: bool):
+        elapsed = time.perf_counter() - self.start
+        error = float(np.max(np.abs(totals / rolls - self.expected))) if rolls else None
+        self.callback(
+            {
+                "rolls": rolls,
+                "elapsed_s": elapsed,
+                "rolls_per_s": rolls / elapsed if elapsed > 0 else None,
+                "max_abs_error": error,
+                "histogram": {s: int(totals[s]) for s in sum_range(self.dice)},
+                "final": final,
+            }
+        )
+        self.next_at = (rolls // self.every + 1) * self.every
+
+
+def print_progress(event):
+    """Найпростіший callback: один рядок у консоль на подію."""
+    rate = event["rolls_per_s"] or 0.0
+    error = event["max_abs_error"] or 0.0
+    print(
+        f"[{event['elapsed_s']:>8.2f} s] {event['rolls']:>14,} кидків"
+        f" | {rate:>14,.0f} кидків/с | max похибка {error:.6f}"
+    )
+
+
+class JsonLinesProgress:
+    """
+    Callback, що пише кожну подію окремим JSON-рядком у файл.
+    Файл перезаписується; якщо задано run (seed, dice, num_rolls, ...),
+    першим рядком іде заголовок {"run": run}.
+    """
+
+    def __init__(self, path: str, run: dict | None = None):
+        self.file = open(path, "w", encoding="utf-8")
+        if run is not None:
+            self.file.write(json.dumps({"run": run}) + "\n")
+
+    def __call__(self, event):
+        self.file.write(json.dumps(event) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class LivePlotProgress:
+    """
+    Callback, що оновлює графік Монте-Карло vs Аналітика на кожній події.
+    Малювання значно дорожче за JSON — варто брати більший progress_every.
+    """
+
+    def __init__(self, dice=TWO_D6):
+        self.dice = normalize_dice(dice)
+        self.x = list(sum_range(self.dice))
+        expected = sum_distribution(self.dice)
+
+        plt.ion()
+        self.fig, self.ax = plt.subplots(figsize=(10, 5))
+        self.ax.plot(
+            self.x, [expected[s] for s in self.x], marker="s", label="Analytic"
+        )
+        (self.line,) = self.ax.plot(
+            self.x, [0.0] * len(self.x), marker="o", label="Monte Carlo"
+        )
+        self.ax.set_xlabel(f"Сума ({self.x[0]}..{self.x[-1]})")
+        self.ax.set_ylabel("Ймовірність")
+        self.ax.grid(True, alpha=0.3)
+        self.ax.legend()
+
+    def __call__(self, event):
+        rolls = event["rolls"]
+        hist = event["histogram"]
+        self.line.set_ydata([hist[s] / rolls for s in self.x])
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.ax.set_title(
+            f"{format_dice(self.dice)}: N={rolls:,},"
+            f" max похибка {event['max_abs_error']:.5f}"
+        )
+        plt.pause(0.001)
+        if event["final"]:
+            plt.ioff()
+
+
+def benchmark_throughput(
+    num_rolls: int,
+    backends=BACKENDS,
+    seed: int | None = 42,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+    dice=TWO_D6,
+    python_max_rolls: int | None = PYTHON_BENCHMARK_MAX_ROLLS,
+):
+    """
+    Вимірює швидкість кожного backend у кидках за секунду.
+    Повертає {backend: (кількість кидків, кидків/с)}; для 'python'
+    кількість обмежена python_max_rolls (None — без обмеження).
+    """
+    results = {}
+    for backend in backends:
+        rolls = num_rolls
+        if backend == "python" and python_max_rolls is not None:
+            rolls = min(num_rolls, python_max_rolls)
+        t0 = time.perf_counter()
+        monte_carlo_dice(
+            rolls,
+            seed=seed,
+            backend=backend,
+            chunk_size=chunk_size,
+            workers=workers,
+            dice=dice,
+        )
+        elapsed = time.perf_counter() - t0
+        results[backend] = (rolls, rolls / elapsed if elapsed > 0 else float("inf"))
+    return results
+
+
 def print_comparison_table(mc_counts, mc_probs, an_counts, an_probs, num_rolls: int):
+    """
+    Таблиця MC vs аналітика. Ширина колонок лічильників підлаштовується під
+    найбільше число; якщо an_counts = None (великий набір) — колонки немає.
+    """
+    sums = sorted(an_probs)
+    mc_w = max(8, len(str(max(mc_counts[s] for s in sums))))
+    header = f"Сума | {'MC_count':>{mc_w}} | MC_prob  |"
+    if an_counts is not None:
+        an_w = max(14, len(str(max(an_counts[s] for s in sums))))
+        header += f" {'Analytic_count':>{an_w}} |"
+    header += " Analytic_prob | Abs_diff"
+
     print(f"\nКількість симуляцій: {num_rolls}")
-    print("Сума | MC_count | MC_prob  | Analytic_count | Analytic_prob | Abs_diff")
-    print("-" * 73)
-    for s in range(2, 13):
+    print(header)
+    print("-" * len(header))
+    for s in sums:
         mc_p = mc_probs[s]
         an_p = an_probs[s]
         diff = abs(mc_p - an_p)
-        print(
-            f"{s:>4} | {mc_counts[s]:>8} | {mc_p:>7.4f} |"
-            f" {an_counts[s]:>13} | {an_p:>12.4f} | {diff:>8.4f}"
-        )
+        row = f"{s:>4} | {mc_counts[s]:>{mc_w}} | {mc_p:>8.4f} |"
+        if an_counts is not None:
+            row += f" {an_counts[s]:>{an_w}} |"
+        row += f" {an_p:>13.4f} | {diff:>8.4f}"
+        print(row)
 
 
-def plot_probabilities(mc_probs, an_probs, num_rolls: int):
-    x = list(range(2, 13))
+def plot_probabilities(mc_probs, an_probs, num_rolls: int, dice=TWO_D6):
+    x = sorted(an_probs)
     y_mc = [mc_probs[s] for s in x]
     y_an = [an_probs[s] for s in x]
 
     plt.figure(figsize=(10, 5))
     plt.plot(x, y_mc, marker="o", label=f"Monte Carlo (N={num_rolls})")
     plt.plot(x, y_an, marker="s", label="Analytic")
-    plt.xticks(x)
-    plt.xlabel("Сума (2..12)")
+    if len(x) <= 30:
+        plt.xticks(x)
+    plt.xlabel(f"Сума ({x[0]}..{x[-1]})")
     plt.ylabel("Ймовірність")
-    plt.title("Ймовірності сум при киданні двох кубиків: Монте-Карло vs Аналітика")
+    plt.title(f"Ймовірності сум для {format_dice(dice)}: Монте-Карло vs Аналітика")
     plt.grid(True, alpha=0.3)
     plt.legend()
     plt.tight_layout()
@@ -64,14 +698,170 @@ def plot_probabilities(mc_probs, an_probs, num_rolls: int):
 
 
 def main():
-    num_rolls = 200_000  # можеш змінити (наприклад 10_000 / 1_000_000)
-    seed = 42  # або None, якщо не потрібна відтворюваність
+    parser = argparse.ArgumentParser(description="Monte Carlo: сума кубиків.")
+    parser.add_argument(
+        "-n",
+        "--rolls",
+        type=int,
+        default=200_000,
+        help="Кількість симуляцій (наприклад 10_000 / 1_000_000). Типово 200000.",
+    )
+    parser.add_argument(
+        "-d",
+        "--dice",
+        type=parse_dice,
+        default=TWO_D6,
+        help="Набір кубиків у форматі NdM, напр. 2d6, 10d20, 3d6+1d4. Типово 2d6.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Seed для відтворюваності. Типово 42.",
+    )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=BACKENDS,
+        default=None,
+        help="Реалізація симуляції. Типово python (для --benchmark — усі).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Розмір блоку кидків для numpy/parallel backend.",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Кількість процесів для parallel backend. Типово — кількість ядер.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=None,
+        help=(
+            "Рання зупинка, коли похибка <= tolerance. Працює лише з parallel"
+            " backend; без -b вмикає його автоматично."
+        ),
+    )
+    parser.add_argument(
+        "--criterion",
+        choices=CRITERIA,
+        default=None,
+        help=(
+            "Критерій зупинки для --tolerance: max похибка vs аналітика"
+            " або ширина 95%% CI. Типово analytic."
+        ),
+    )
+    parser.add_argument(
+        "--progress",
+        choices=PROGRESS_SINKS,
+        default=None,
+        help="Живий прогрес: у консоль, у JSON-lines файл або на графік.",
+    )
+    parser.add_argument(
+        "--progress-every",
+        type=int,
+        default=DEFAULT_PROGRESS_EVERY,
+        help="Як часто (у кидках) надсилати подію прогресу.",
+    )
+    parser.add_argument(
+        "--progress-log",
+        default="progress.jsonl",
+        help="Файл для --progress jsonl. Типово progress.jsonl.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help=(
+            "Лише виміряти швидкість (кидків/с) backend з -b або всіх, без графіка."
+            f" Без -b python обмежено {PYTHON_BENCHMARK_MAX_ROLLS:,} кидками."
+        ),
+    )
+    args = parser.parse_args()
+
+    if args.criterion is not None and args.tolerance is None:
+        parser.error("--criterion має сенс лише разом із --tolerance.")
+    if args.tolerance is not None:
+        if args.benchmark:
+            parser.error("--tolerance не поєднується з --benchmark.")
+        if args.backend not in (None, "parallel"):
+            parser.error(
+                "--tolerance (рання зупинка) підтримує лише -b parallel,"
+                f" а не -b {args.backend}."
+            )
+        args.backend = "parallel"
+
+    if args.benchmark:
+        rates = benchmark_throughput(
+            args.rolls,
+            backends=(args.backend,) if args.backend else BACKENDS,
+            seed=args.seed,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            dice=args.dice,
+            python_max_rolls=None if args.backend else PYTHON_BENCHMARK_MAX_ROLLS,
+        )
+        print(f"\nКількість симуляцій: {args.rolls}")
+        for backend, (rolls, rate) in rates.items():
+            note = f" (обмежено до {rolls:,} кидків)" if rolls < args.rolls else ""
+            print(f"{backend:>8}: {rate:>15,.0f} кидків/с{note}")
+        return
+
+    backend = args.backend or "python"
+    progress = None
+    if args.progress == "console":
+        progress = print_progress
+    elif args.progress == "jsonl":
+        progress = JsonLinesProgress(
+            args.progress_log,
+            run={
+                "seed": args.seed,
+                "dice": format_dice(args.dice),
+                "num_rolls": args.rolls,
+                "backend": backend,
+                "chunk_size": args.chunk_size,
+                "progress_every": args.progress_every,
+            },
+        )
+    elif args.progress == "plot":
+        progress = LivePlotProgress(args.dice)
 
-    an_probs, an_counts = analytic_probabilities()
-    mc_counts, mc_probs = monte_carlo_dice(num_rolls=num_rolls, seed=seed)
+    an_probs, an_counts = analytic_probabilities(args.dice)
+    try:
+        if backend == "parallel":
+            mc_counts, mc_probs = monte_carlo_dice_parallel(
+                args.rolls,
+                seed=args.seed,
+                workers=args.workers,
+                batch_size=args.chunk_size,
+                tolerance=args.tolerance,
+                criterion=args.criterion or "analytic",
+                dice=args.dice,
+                progress=progress,
+                progress_every=args.progress_every,
+            )
+        else:
+            mc_counts, mc_probs = monte_carlo_dice(
+                num_rolls=args.rolls,
+                seed=args.seed,
+                backend=backend,
+                chunk_size=args.chunk_size,
+                dice=args.dice,
+                progress=progress,
+                progress_every=args.progress_every,
+            )
+    finally:
+        if isinstance(progress, JsonLinesProgress):
+            progress.close()
+    num_rolls = sum(mc_counts.values())  # при ранній зупинці < args.rolls
 
     print_comparison_table(mc_counts, mc_probs, an_counts, an_probs, num_rolls)
-    plot_probabilities(mc_probs, an_probs, num_rolls)
+    plot_probabilities(mc_probs, an_probs, num_rolls, dice=args.dice)
 
 
 if __name__ == "__main__":